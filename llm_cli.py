@@ -0,0 +1,552 @@
+#!/usr/bin/env python3
+import hashlib
+import sqlite3
+import sys
+import time
+from array import array
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import TYPE_CHECKING, Iterable, Iterator, List, Optional, Tuple
+
+if TYPE_CHECKING:
+    import httpx
+    from rich.console import Console
+    from rich.live import Live
+
+try:
+    from orjson import loads as _loads
+except ImportError:
+    from json import loads as _loads  # type: ignore[assignment]
+
+_CONSOLE: Optional["Console"] = None
+_CLIENT: Optional["httpx.Client"] = None
+OLLAMA_HOST = "localhost"
+OLLAMA_PORT = 11434
+OLLAMA_API = f"http://{OLLAMA_HOST}:{OLLAMA_PORT}/api/generate"
+OLLAMA_EMBEDDINGS_API = f"http://{OLLAMA_HOST}:{OLLAMA_PORT}/api/embeddings"
+EMBEDDING_MODEL = "nomic-embed-text"
+CACHE_DB = Path.home() / ".cache" / "llm-cli" / "cache.sqlite3"
+CACHE_SIMILARITY = 0.95
+CACHE_MAX_ROWS = 5000
+OLLAMA_NUM_CTX = 4096
+STREAM_FLUSH_INTERVAL = 0.05
+SUMMARY_MAX_CHARS = 8000
+# Enough bytes for SUMMARY_MAX_CHARS characters of UTF-8 at up to 4 bytes each
+SUMMARY_READ_BYTES = 32_768
+DEFAULT_MODEL = "phi3:latest"
+ALIAS_MAP = {
+    "qwen": "qwen3-vl:235b-cloud",
+    "deepseek": "deepseek-r1:8b",
+    "phi3": "phi3:latest",
+}
+# Static instructions go in Ollama's system field so they stay byte-identical
+# across calls; only the templates below carry per-call text.
+QA_SYSTEM = (
+    "You are a concise command-line assistant. "
+    "Return clear answers and minimal explanations, using code blocks where helpful."
+)
+QA_TEMPLATE = "Question: {question}\n"
+SUMMARISE_SYSTEM = (
+    "You are an expert technical writer, not a shell or programming assistant. "
+    "Your only job is to read the following text and produce a short, clear summary "
+    "in natural language. Do NOT output code, commands, or instructions. "
+    "Respond in plain English prose in 3-5 sentences."
+)
+SUMMARISE_TEMPLATE = "--- BEGIN TEXT ---\n{text}\n--- END TEXT ---\n\nSummary:"
+
+# Lowercase alias or full model name -> full model name
+_ALIAS_LOOKUP = {alias.lower(): actual for alias, actual in ALIAS_MAP.items()}
+_ALIAS_LOOKUP.update({actual.lower(): actual for actual in ALIAS_MAP.values()})
+
+def _console() -> "Console":
+    """Return the shared rich Console, importing rich on first use."""
+    global _CONSOLE
+    if _CONSOLE is None:
+        from rich.console import Console
+        # No auto-highlighting, so model output is never run through its regexes
+        _CONSOLE = Console(highlight=False)
+    return _CONSOLE
+
+def _client() -> "httpx.Client":
+    """Return the shared keep-alive httpx Client, importing httpx on first use."""
+    global _CLIENT
+    if _CLIENT is None:
+        import httpx
+        # Ollama only speaks HTTP/1.1, so no http2
+        _CLIENT = httpx.Client(
+            timeout=httpx.Timeout(60.0, connect=2.0),
+            transport=httpx.HTTPTransport(retries=0),
+        )
+    return _CLIENT
+
+def resolve_model_name(requested_name: str) -> str:
+    """Map alias to actual model name in ollama"""
+    if not requested_name:
+        return requested_name
+
+    requested_name = requested_name.strip()
+    if not requested_name:
+        return requested_name
+
+    resolved = _ALIAS_LOOKUP.get(requested_name.lower())
+    if resolved is None:
+        raise ValueError("that model isn't available")
+    return resolved
+
+class OllamaNotRunning(Exception):
+    """Raised when the Ollama server can't be reached."""
+
+def exit_not_running() -> None:
+    _console().print("[bold red]❌ Ollama server not running.[/bold red]")
+    _console().print("Start it with: [yellow]brew services start ollama[/yellow]")
+    sys.exit(1)
+
+def is_ollama_running() -> bool:
+    """Check that something is listening on Ollama's port with a bare TCP connect."""
+    import socket
+
+    try:
+        socket.create_connection((OLLAMA_HOST, OLLAMA_PORT), timeout=0.05).close()
+        return True
+    except OSError:
+        return False
+
+def query_ollama(prompt: str, model: str = DEFAULT_MODEL, system: Optional[str] = None) -> Iterator[str]:
+    """Query Ollama's local API and yield the model output as it is generated."""
+    import httpx
+
+    payload = {
+        "model": model,
+        "prompt": prompt,
+        "stream": True,
+        "options": {"num_ctx": OLLAMA_NUM_CTX},
+    }
+    if system is not None:
+        payload["system"] = system
+
+    client = _client()
+    request = client.build_request(
+        "POST",
+        OLLAMA_API,
+        json=payload,
+        timeout=httpx.Timeout(5.0, read=None)
+    )
+    try:
+        response = client.send(request, stream=True)
+    except (httpx.ConnectError, httpx.ConnectTimeout) as err:
+        raise OllamaNotRunning() from err
+
+    try:
+        response.raise_for_status()
+        for line in response.iter_lines():
+            if not line:
+                continue
+            chunk = _loads(line)
+            if chunk.get("error"):
+                raise RuntimeError(chunk["error"])
+            delta = chunk.get("response", "")
+            if delta:
+                yield delta
+            if chunk.get("done"):
+                break
+        else:
+            # Never cache or present a cut-off stream as a full answer
+            raise RuntimeError("Ollama closed the stream before the answer was complete")
+    finally:
+        response.close()
+
+class StreamPrinter:
+    """Print streamed text as it arrives, switching to Markdown from the first code fence."""
+
+    def __init__(self, console: "Console", style: str = "") -> None:
+        self.console = console
+        self.style = style
+        self.pending = ""
+        self.at_line_start = True
+        self.live: Optional["Live"] = None
+        # Markdown mode: finished lines of the current block and the unfinished line
+        self.block = ""
+        self.line = ""
+        self.in_code = False
+        self.fence = ""
+
+    def feed(self, delta: str) -> None:
+        if self.live is None:
+            self.pending += delta
+            fence = self.pending.find("```")
+            if fence < 0:
+                return
+            before, delta = self.pending[:fence], self.pending[fence:]
+            self.pending = ""
+            self._out(before)
+            if not self.at_line_start:
+                self._out("\n")
+            from rich.live import Live
+            # Only the unfinished block lives here; finished blocks are printed
+            # above it, so long answers never overflow the live region
+            self.live = Live(console=self.console, auto_refresh=False, transient=True)
+            self.live.start()
+
+        self.line += delta
+        *lines, self.line = self.line.split("\n")
+        for line in lines:
+            self.block += line + "\n"
+            stripped = line.strip()
+            if stripped.startswith("```"):
+                self.in_code = not self.in_code
+                self.fence = line + "\n"
+                if not self.in_code:
+                    self._print_block()
+            elif not stripped and not self.in_code:
+                self._print_block()
+            elif self.block.count("\n") >= self.console.height - 2:
+                # Too tall for the live region: print the finished lines now,
+                # carrying an open code block on in a fresh one
+                if self.in_code:
+                    self.block += "```\n"
+                    self._print_block()
+                    self.block = self.fence
+                else:
+                    self._print_block()
+
+    def flush(self) -> None:
+        if self.live is None:
+            # Hold back trailing backticks in case they start a fence
+            keep = len(self.pending) - len(self.pending.rstrip("`"))
+            self._out(self.pending[:len(self.pending) - keep])
+            self.pending = self.pending[len(self.pending) - keep:]
+        else:
+            from rich.markdown import Markdown
+            self.live.update(Markdown(self.block + self.line), refresh=True)
+
+    def close(self) -> None:
+        if self.live is None:
+            self._out(self.pending)
+            self.pending = ""
+            if not self.at_line_start:
+                self._out("\n")
+            return
+        self.block += self.line
+        self.line = ""
+        self.live.stop()
+        self.live = None
+        self._print_block()
+
+    def _out(self, text: str) -> None:
+        if text:
+            self.console.out(text, style=self.style or None, highlight=False, end="")
+            self.at_line_start = text.endswith("\n")
+
+    def _print_block(self) -> None:
+        from rich.markdown import Markdown
+        block, self.block = self.block, ""
+        if self.live is not None:
+            # Drop the block from the live region before printing it above
+            self.live.update(Markdown(self.line))
+        if block.strip():
+            self.console.print(Markdown(block))
+
+def strip_stream(deltas: Iterable[str]) -> Iterator[str]:
+    """Yield deltas with whitespace around the whole text stripped, like str.strip()."""
+    started = False
+    held = ""
+    for delta in deltas:
+        if not started:
+            delta = delta.lstrip()
+            if not delta:
+                continue
+            started = True
+        body = delta.rstrip()
+        if body:
+            yield held + body
+            held = delta[len(body):]
+        else:
+            held += delta
+
+def print_stream(deltas: Iterable[str], raw: bool = False, style: str = "") -> str:
+    """Print streamed model output as it arrives and return the full text."""
+    deltas = strip_stream(deltas)
+    if raw:
+        parts: List[str] = []
+        last = time.monotonic()
+        try:
+            for delta in deltas:
+                parts.append(delta)
+                sys.stdout.write(delta)
+                now = time.monotonic()
+                if now - last > STREAM_FLUSH_INTERVAL or "\n" in delta:
+                    sys.stdout.flush()
+                    last = now
+        finally:
+            if parts:
+                sys.stdout.write("\n")
+            sys.stdout.flush()
+        return "".join(parts)
+
+    printer = StreamPrinter(_console(), style=style)
+    parts = []
+    last = time.monotonic()
+    try:
+        for delta in deltas:
+            parts.append(delta)
+            printer.feed(delta)
+            now = time.monotonic()
+            if now - last > STREAM_FLUSH_INTERVAL or "\n" in delta:
+                printer.flush()
+                last = now
+    finally:
+        printer.close()
+    return "".join(parts)
+
+def get_embedding(text: str) -> Optional[List[float]]:
+    """Embed text with Ollama, or return None if embeddings are unavailable."""
+    import httpx
+
+    try:
+        response = _client().post(
+            OLLAMA_EMBEDDINGS_API,
+            json={"model": EMBEDDING_MODEL, "prompt": text},
+            timeout=10
+        )
+        response.raise_for_status()
+    except httpx.HTTPError:
+        return None
+    return _loads(response.content).get("embedding") or None
+
+def open_cache() -> Optional[sqlite3.Connection]:
+    """Open the on-disk prompt cache, or return None if it can't be used."""
+    try:
+        CACHE_DB.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(CACHE_DB)
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS cache ("
+            "hash TEXT PRIMARY KEY, model TEXT, system TEXT, prompt TEXT, "
+            "embedding BLOB, answer TEXT, ts INT)"
+        )
+    except (OSError, sqlite3.Error):
+        return None
+    return conn
+
+def cache_key(model: str, system: Optional[str], prompt: str) -> str:
+    return hashlib.sha256(f"{model}\0{system or ''}\0{prompt}".encode("utf-8")).hexdigest()
+
+def cache_lookup(
+    conn: sqlite3.Connection, model: str, system: Optional[str], prompt: str
+) -> Optional[str]:
+    """Return the cached answer for exactly this model, system and prompt, if any."""
+    key = cache_key(model, system, prompt)
+    row = conn.execute("SELECT answer FROM cache WHERE hash = ?", (key,)).fetchone()
+    if row is None:
+        return None
+    conn.execute("UPDATE cache SET ts = ? WHERE hash = ?", (int(time.time()), key))
+    conn.commit()
+    answer: str = row[0]
+    return answer
+
+def cache_search(
+    conn: sqlite3.Connection, model: str, system: Optional[str], embedding: List[float]
+) -> Optional[str]:
+    """Return the closest cached answer at or above CACHE_SIMILARITY (needs numpy)."""
+    try:
+        import numpy as np
+    except ImportError:
+        return None
+
+    query = np.asarray(embedding, dtype=np.float32)
+    rows: List[Tuple[str, bytes, str]] = [
+        (row_hash, blob, answer)
+        for row_hash, blob, answer in conn.execute(
+            "SELECT hash, embedding, answer FROM cache "
+            "WHERE model = ? AND system IS ? AND embedding IS NOT NULL",
+            (model, system)
+        )
+        if len(blob) == query.nbytes
+    ]
+    if not rows:
+        return None
+
+    vectors = np.frombuffer(b"".join(blob for _, blob, _ in rows), dtype=np.float32)
+    vectors = vectors.reshape(len(rows), query.size)
+    norms = np.linalg.norm(vectors, axis=1) * np.linalg.norm(query)
+    scores = (vectors @ query) / np.where(norms == 0, 1, norms)
+    best = int(scores.argmax())
+    if scores[best] < CACHE_SIMILARITY:
+        return None
+
+    row_hash, _, answer = rows[best]
+    conn.execute("UPDATE cache SET ts = ? WHERE hash = ?", (int(time.time()), row_hash))
+    conn.commit()
+    return answer
+
+def cache_store(
+    conn: sqlite3.Connection,
+    model: str,
+    system: Optional[str],
+    prompt: str,
+    embedding: Optional[List[float]],
+    answer: str,
+) -> None:
+    """Store an answer and evict the least recently used rows past CACHE_MAX_ROWS."""
+    blob = array("f", embedding).tobytes() if embedding else None
+    conn.execute(
+        "INSERT OR REPLACE INTO cache (hash, model, system, prompt, embedding, answer, ts) "
+        "VALUES (?, ?, ?, ?, ?, ?, ?)",
+        (cache_key(model, system, prompt), model, system, prompt, blob, answer, int(time.time()))
+    )
+    conn.execute(
+        "DELETE FROM cache WHERE hash IN "
+        "(SELECT hash FROM cache ORDER BY ts DESC LIMIT -1 OFFSET ?)",
+        (CACHE_MAX_ROWS,)
+    )
+    conn.commit()
+
+def ask(
+    prompt: str,
+    model: str = DEFAULT_MODEL,
+    system: Optional[str] = None,
+    raw: bool = False,
+    style: str = "",
+    use_cache: bool = True,
+    similar: bool = True,
+) -> str:
+    """Answer prompt from the prompt cache if possible, otherwise from the LLM."""
+    conn = open_cache() if use_cache else None
+    if conn is None:
+        return print_stream(query_ollama(prompt, model=model, system=system), raw=raw, style=style)
+
+    try:
+        embedding = None
+        try:
+            answer = cache_lookup(conn, model, system, prompt)
+            if answer is None and similar:
+                embedding = get_embedding(prompt)
+                if embedding is not None:
+                    answer = cache_search(conn, model, system, embedding)
+        except sqlite3.Error:
+            return print_stream(query_ollama(prompt, model=model, system=system), raw=raw, style=style)
+        if answer is not None:
+            return print_stream([answer], raw=raw, style=style)
+
+        answer = print_stream(query_ollama(prompt, model=model, system=system), raw=raw, style=style)
+        if answer:
+            try:
+                cache_store(conn, model, system, prompt, embedding, answer)
+            except sqlite3.Error:
+                pass
+        return answer
+    finally:
+        conn.close()
+
+def summarise_file(file_path: str, model: str = DEFAULT_MODEL, use_cache: bool = True) -> None:
+    """Read a file and summarise its contents using the local LLM."""
+    path = Path(file_path)
+    if not path.exists() or not path.is_file():
+        _console().print(f"[red]File not found:[/red] {file_path}")
+        sys.exit(1)
+
+    try:
+        with path.open("rb") as f:
+            raw = f.read(SUMMARY_READ_BYTES)
+    except Exception as e:
+        _console().print(f"[red]Error reading file:[/red] {e}")
+        sys.exit(1)
+
+    text = raw.decode("utf-8", errors="ignore")[:SUMMARY_MAX_CHARS]
+    if not text.strip():
+        _console().print("[yellow]File is empty, nothing to summarise.[/yellow]")
+        sys.exit(1)
+
+    _console().print(f"[cyan]📄 Summarising:[/cyan] {file_path}")
+
+    prompt = SUMMARISE_TEMPLATE.format_map({"text": text})
+
+    _console().print("\n[bold green]🧠 Summary:[/bold green]\n")
+    try:
+        # Exact cache hits only, so an edited file never gets its old summary
+        ask(prompt, model=model, system=SUMMARISE_SYSTEM, use_cache=use_cache, similar=False)
+    except OllamaNotRunning:
+        exit_not_running()
+    except Exception as e:
+        _console().print(f"[bold red]Error:[/bold red] {e}")
+        sys.exit(1)
+
+@dataclass
+class Args:
+    verbose: bool = False
+    raw: bool = False
+    use_cache: bool = True
+    model: str = DEFAULT_MODEL
+    model_specified: bool = False
+    summarise: Optional[str] = None
+    question: List[str] = field(default_factory=list)
+
+def parse(argv: List[str]) -> Args:
+    """Parse CLI args in a single pass over argv."""
+    args = Args()
+    it = iter(argv)
+    for tok in it:
+        if tok == "--verbose":
+            args.verbose = True
+        elif tok == "--raw":
+            args.raw = True
+        elif tok == "--no-cache":
+            args.use_cache = False
+        elif tok == "--model":
+            try:
+                args.model = next(it)
+            except StopIteration:
+                raise ValueError("Missing model name after --model") from None
+            args.model_specified = True
+        elif tok == "--summarise":
+            try:
+                args.summarise = next(it)
+            except StopIteration:
+                raise ValueError("Missing file path after --summarise") from None
+        else:
+            args.question.append(tok)
+    return args
+
+def main() -> None:
+    if len(sys.argv) < 2:
+        sys.stderr.write("Usage: llm [--verbose|--raw] [--no-cache] [--model MODEL] [--summarise FILE] <your question>\n")
+        sys.exit(1)
+
+    # Parse CLI args
+    try:
+        args = parse(sys.argv[1:])
+    except ValueError as err:
+        _console().print(f"[red]{err}[/red]")
+        sys.exit(1)
+
+    model = args.model
+    try:
+        resolved_model = resolve_model_name(model)
+    except ValueError as err:
+        _console().print(f"[bold red]{err}[/bold red]")
+        sys.exit(1)
+
+    if resolved_model != model and args.model_specified:
+        _console().print(f"[cyan]Using model:[/cyan] {resolved_model} (matched from '{model}')")
+
+    # Handle summarise flag
+    if args.summarise is not None:
+        summarise_file(args.summarise, model=resolved_model, use_cache=args.use_cache)
+        sys.exit(0)
+
+    # Handle normal question mode
+    question = " ".join(args.question)
+
+    if args.verbose:
+        _console().print(f"[bold cyan]🤖 Asking local LLM ({resolved_model}):[/bold cyan] {question}\n")
+
+    prompt = QA_TEMPLATE.format_map({"question": question})
+
+    try:
+        ask(prompt, model=resolved_model, system=QA_SYSTEM, raw=args.raw, style="green", use_cache=args.use_cache)
+    except OllamaNotRunning:
+        exit_not_running()
+    except Exception as e:
+        _console().print(f"[bold red]Error:[/bold red] {e}")
+
+if __name__ == "__main__":
+    main()